@@ -7,6 +7,17 @@ from pathlib import Path
 from mcp2skill import __version__
 from mcp2skill.generator import SkillGenerator
 
+_DEFAULT_ENDPOINT = 'http://localhost:28888'
+
+# Styled (symbol, status) pairs for the `servers` listing, built once
+_STATUS_STYLES = {
+    status: (click.style(symbol, fg=color), click.style(status, fg=color))
+    for status, symbol, color in (
+        ('connected', '✓', 'green'),
+        ('disconnected', '✗', 'red'),
+    )
+}
+
 
 @click.group()
 @click.version_option(version=__version__, prog_name="mcp2skill")
@@ -22,8 +33,8 @@ def cli():
 @cli.command()
 @click.option(
     '--endpoint',
-    default='http://localhost:28888',
-    help='mcp2rest service URL (default: http://localhost:28888)',
+    default=_DEFAULT_ENDPOINT,
+    help=f'mcp2rest service URL (default: {_DEFAULT_ENDPOINT})',
     show_default=True
 )
 def servers(endpoint):
@@ -46,18 +57,13 @@ def servers(endpoint):
             transport = server.get('transport', 'unknown')
 
             # Color-code status
-            if status == 'connected':
-                status_color = 'green'
-                status_symbol = '✓'
-            elif status == 'disconnected':
-                status_color = 'red'
-                status_symbol = '✗'
-            else:
-                status_color = 'yellow'
-                status_symbol = '!'
-
-            click.echo(f"  {click.style(status_symbol, fg=status_color)} {name}")
-            click.echo(f"    Status: {click.style(status, fg=status_color)}")
+            styled = _STATUS_STYLES.get(status)
+            if styled is None:
+                styled = (click.style('!', fg='yellow'), click.style(status, fg='yellow'))
+            styled_symbol, styled_status = styled
+
+            click.echo(f"  {styled_symbol} {name}")
+            click.echo(f"    Status: {styled_status}")
             click.echo(f"    Tools: {tool_count}")
             click.echo(f"    Transport: {transport}")
 
@@ -92,7 +98,7 @@ def servers(endpoint):
 )
 @click.option(
     '--endpoint',
-    default='http://localhost:28888',
+    default=_DEFAULT_ENDPOINT,
     help='mcp2rest service URL',
     show_default=True
 )
@@ -155,7 +161,7 @@ def generate(server_name, all, output, endpoint):
 
             # Count generated scripts
             scripts_dir = skill_dir / "scripts"
-            script_count = len(list(scripts_dir.glob("*.py"))) - 1  # Exclude mcp_client.py
+            script_count = sum(1 for _ in scripts_dir.glob("*.py")) - 1  # Exclude mcp_client.py
 
             click.echo(f"{click.style('✓', fg='green')} Generated skill: {skill_dir}")
             click.echo(f"  SKILL.md: {skill_dir / 'SKILL.md'}")
@@ -183,7 +189,7 @@ def generate(server_name, all, output, endpoint):
 @click.argument('server_name')
 @click.option(
     '--endpoint',
-    default='http://localhost:28888',
+    default=_DEFAULT_ENDPOINT,
     help='mcp2rest service URL',
     show_default=True
 )
@@ -225,7 +231,8 @@ def tools(server_name, endpoint):
             if required:
                 click.echo(f"    Required: {', '.join(required)}")
 
-            optional = [p for p in properties.keys() if p not in required]
+            required_set = set(required)
+            optional = [p for p in properties if p not in required_set]
             if optional:
                 click.echo(f"    Optional: {', '.join(optional)}")
 
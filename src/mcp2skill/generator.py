@@ -1,12 +1,64 @@
 """Generate Claude Code skills from mcp2rest servers."""
 
-import json
-import requests
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 from mcp2skill.templates import create_skill_md, create_mcp_client_script, create_tool_script
-from mcp2skill.schema_utils import generate_argparse_from_schema
+
+# Upper bound on servers generated concurrently by generate_all_skills
+_MAX_WORKERS = 8
+
+
+def _scan_dir(directory: Path) -> dict[str, os.stat_result]:
+    """Stat every entry of a directory in a single scan."""
+    with os.scandir(directory) as entries:
+        return {entry.name: entry.stat() for entry in entries}
+
+
+def _write_if_changed(
+    path: Path,
+    content: str,
+    mode: int | None = None,
+    existing: dict[str, os.stat_result] | None = None
+) -> bool:
+    """Write a generated file as UTF-8 unless it already has this content.
+
+    Re-running generation then leaves unchanged files (and their mtimes)
+    alone, so editors and file watchers aren't triggered needlessly.
+
+    Args:
+        path: File to write
+        content: Generated file content
+        mode: Permission bits to ensure on the file, if any
+        existing: Stat results for path's directory from _scan_dir(), to
+            avoid a stat per file
+
+    Returns:
+        True if the file was written
+    """
+    data = content.encode('utf-8')
+    if existing is not None:
+        st = existing.get(path.name)
+    else:
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            st = None
+
+    # Only read the old file back when the size matches
+    if st is None or st.st_size != len(data):
+        changed = True
+    else:
+        changed = path.read_bytes() != data
+
+    if changed:
+        path.write_bytes(data)
+    if mode is not None and (st is None or stat.S_IMODE(st.st_mode) != mode):
+        path.chmod(mode)
+    return changed
 
 
 class SkillGenerator:
@@ -19,10 +71,54 @@ class SkillGenerator:
             mcp2rest_url: Base URL of mcp2rest service (default: http://localhost:28888)
         """
         self.base_url = mcp2rest_url.rstrip('/')
+        self._servers: list[dict[str, Any]] | None = None
+
+        # requests is imported here rather than at module level so that
+        # `mcp2skill --help` doesn't pay for loading it.
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util import Retry
+
+        # One pooled session for all mcp2rest calls, so repeated requests
+        # (e.g. generate --all) reuse the same keep-alive connection.
+        # Connection refusals fail fast and read timeouts surface as
+        # Timeout rather than being retried; gateway errors are retried.
+        self._session = requests.Session()
+        self._session.headers.update({"Accept": "application/json"})
+        adapter = HTTPAdapter(
+            # Enough connections for every generate_all_skills worker
+            pool_maxsize=_MAX_WORKERS,
+            max_retries=Retry(
+                total=3,
+                connect=0,
+                read=False,
+                backoff_factor=0.3,
+                status_forcelist=(502, 503, 504),
+                raise_on_status=False,
+            )
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self._session.close()
 
-    def list_servers(self) -> list[dict[str, Any]]:
+    def __enter__(self) -> "SkillGenerator":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def list_servers(self, refresh: bool = False) -> list[dict[str, Any]]:
         """Get all servers from mcp2rest.
 
+        The response is cached on the generator, so later lookups
+        (get_server_info, error messages) don't hit mcp2rest again.
+
+        Args:
+            refresh: Re-fetch the server list even if it is cached
+
         Returns:
             List of server info dictionaries
 
@@ -30,10 +126,16 @@ class SkillGenerator:
             ConnectionError: If cannot connect to mcp2rest
             requests.HTTPError: If request fails
         """
+        if self._servers is not None and not refresh:
+            return self._servers
+
+        import requests
+
         try:
-            resp = requests.get(f"{self.base_url}/servers", timeout=10)
+            resp = self._session.get(f"{self.base_url}/servers", timeout=10)
             resp.raise_for_status()
-            return resp.json()
+            self._servers = resp.json()
+            return self._servers
         except requests.exceptions.ConnectionError as e:
             raise ConnectionError(
                 f"Cannot connect to mcp2rest at {self.base_url}. "
@@ -57,8 +159,10 @@ class SkillGenerator:
             ValueError: If server not found
             requests.HTTPError: If request fails
         """
+        import requests
+
         try:
-            resp = requests.get(
+            resp = self._session.get(
                 f"{self.base_url}/servers/{server_name}/tools",
                 timeout=10
             )
@@ -90,7 +194,8 @@ class SkillGenerator:
     def generate_skill(
         self,
         server_name: str,
-        output_dir: str | Path = "~/.claude/skills"
+        output_dir: str | Path = "~/.claude/skills",
+        server_info: dict[str, Any] | None = None
     ) -> Path:
         """Generate Claude Code skill for an MCP server.
 
@@ -106,6 +211,8 @@ class SkillGenerator:
         Args:
             server_name: Name of the MCP server in mcp2rest
             output_dir: Directory to create skill in (default: ~/.claude/skills)
+            server_info: Server entry from list_servers(), if the caller
+                already has it (skips the lookup)
 
         Returns:
             Path to generated skill directory
@@ -118,7 +225,8 @@ class SkillGenerator:
         output_path = Path(output_dir).expanduser()
 
         # Get server info and tools
-        server_info = self.get_server_info(server_name)
+        if server_info is None:
+            server_info = self.get_server_info(server_name)
         if not server_info:
             raise ValueError(
                 f"Server '{server_name}' not found in mcp2rest. "
@@ -131,64 +239,90 @@ class SkillGenerator:
                 f"Server '{server_name}' has no tools available."
             )
 
-        # Create skill directory
+        # Create skill and scripts directories up front, and snapshot what
+        # is already there so unchanged files can be skipped cheaply
         skill_dir = output_path / f"mcp-{server_name}"
-        skill_dir.mkdir(parents=True, exist_ok=True)
-
-        # Generate SKILL.md
-        skill_md = create_skill_md(
-            server_name=server_name,
-            server_info=server_info,
-            tools=tools,
-            mcp2rest_url=self.base_url
-        )
-        (skill_dir / "SKILL.md").write_text(skill_md)
-
-        # Create scripts directory
         scripts_dir = skill_dir / "scripts"
-        scripts_dir.mkdir(exist_ok=True)
-
-        # Generate shared mcp_client.py utility
-        mcp_client_code = create_mcp_client_script(self.base_url)
-        (scripts_dir / "mcp_client.py").write_text(mcp_client_code)
-
-        # Generate Python script for each tool
+        scripts_dir.mkdir(parents=True, exist_ok=True)
+        skill_entries = _scan_dir(skill_dir)
+        script_entries = _scan_dir(scripts_dir)
+
+        # Generate SKILL.md and the shared mcp_client.py utility
+        files: list[tuple[Path, str, int | None, dict[str, os.stat_result]]] = [
+            (
+                skill_dir / "SKILL.md",
+                create_skill_md(
+                    server_name=server_name,
+                    server_info=server_info,
+                    tools=tools,
+                    mcp2rest_url=self.base_url
+                ),
+                None,
+                skill_entries,
+            ),
+            (
+                scripts_dir / "mcp_client.py",
+                create_mcp_client_script(self.base_url),
+                None,
+                script_entries,
+            ),
+        ]
+
+        # Generate an executable Python script for each tool
         for tool in tools:
             script_code = create_tool_script(
                 server_name=server_name,
                 tool=tool
             )
-            script_file = scripts_dir / f"{tool['name']}.py"
-            script_file.write_text(script_code)
-            # Make executable
-            script_file.chmod(0o755)
+            files.append(
+                (scripts_dir / f"{tool['name']}.py", script_code, 0o755, script_entries)
+            )
+
+        # Written sequentially; generate_all_skills already runs one
+        # generate_skill per worker, so a pool here would nest inside its pool
+        for path, content, mode, entries in files:
+            _write_if_changed(path, content, mode, entries)
 
         return skill_dir
 
     def generate_all_skills(
         self,
-        output_dir: str | Path = "~/.claude/skills"
+        output_dir: str | Path = "~/.claude/skills",
+        refresh: bool = False
     ) -> list[Path]:
         """Generate skills for all servers in mcp2rest.
 
+        The server list is fetched once and each entry is handed to
+        generate_skill(), so /servers is not queried again per server.
+
         Args:
             output_dir: Directory to create skills in (default: ~/.claude/skills)
+            refresh: Re-fetch the server list even if it is cached
 
         Returns:
             List of paths to generated skill directories
         """
-        servers = self.list_servers()
+        servers = [
+            server for server in self.list_servers(refresh=refresh)
+            if server['status'] == 'connected' and server.get('toolCount', 0) > 0
+        ]
+        if not servers:
+            return []
+
+        # Servers are independent, so fetch tools and write files in parallel.
+        # Results are collected in server order to keep output deterministic.
         generated = []
-
-        for server in servers:
-            if server['status'] == 'connected' and server.get('toolCount', 0) > 0:
+        with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(servers))) as pool:
+            futures = [
+                (server['name'], pool.submit(
+                    self.generate_skill, server['name'], output_dir, server_info=server
+                ))
+                for server in servers
+            ]
+            for name, future in futures:
                 try:
-                    skill_dir = self.generate_skill(
-                        server['name'],
-                        output_dir
-                    )
-                    generated.append(skill_dir)
+                    generated.append(future.result())
                 except Exception as e:
-                    print(f"Warning: Failed to generate skill for {server['name']}: {e}")
+                    print(f"Warning: Failed to generate skill for {name}: {e}")
 
         return generated
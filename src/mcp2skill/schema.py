@@ -6,7 +6,13 @@ This module provides utilities for:
 - JSON Schema to Python type mapping
 """
 
+import inspect
 import re
+from typing import Any
+
+# Compiled once at import; camel_to_snake runs for every tool and property name.
+_CAMEL_WORD_RE = re.compile(r"(.)([A-Z][a-z]+)")
+_CAMEL_BOUNDARY_RE = re.compile(r"([a-z0-9])([A-Z])")
 
 
 def parse_command(command: str | list[str]) -> list[str]:
@@ -51,9 +57,9 @@ def camel_to_snake(name: str) -> str:
         'simple'
     """
     # Insert underscore before uppercase letters that follow lowercase
-    s1 = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", name)
+    s1 = _CAMEL_WORD_RE.sub(r"\1_\2", name)
     # Insert underscore before uppercase letters that follow lowercase or digit
-    s2 = re.sub("([a-z0-9])([A-Z])", r"\1_\2", s1)
+    s2 = _CAMEL_BOUNDARY_RE.sub(r"\1_\2", s1)
     return s2.lower()
 
 
@@ -155,9 +161,6 @@ def create_function_with_signature(
         >>> list(sig.parameters.keys())
         ['url', 'timeout']
     """
-    from typing import Any
-    import inspect
-
     # Extract parameters from schema
     properties = input_schema.get("properties", {})
     required = set(input_schema.get("required", []))
@@ -1,9 +1,111 @@
 """Utilities for converting JSON Schema to Python argparse code."""
 
-import json
+import functools
+import textwrap
 from typing import Any
 
-
+_SNAKE_TO_KEBAB = str.maketrans('_', '-')
+_KEBAB_TO_SNAKE = str.maketrans('-', '_')
+
+# Escapes for descriptions placed inside double-quoted help="..." strings
+_ESCAPE_HELP = str.maketrans({'\\': '\\\\', '"': '\\"', '\n': '\\n'})
+
+# parser.add_argument(...) fragments, keyed by JSON type ('enum' for
+# strings with choices). Filled with str.format_map per property.
+_ARGPARSE_TEMPLATES = {
+    'boolean': (
+        'parser.add_argument(\n'
+        '    "--{cli}",\n'
+        '    action="store_true",\n'
+        '    help="{desc}"\n'
+        ')'
+    ),
+    'integer': (
+        'parser.add_argument(\n'
+        '    "--{cli}",\n'
+        '    type=int,\n'
+        '    {required}\n'
+        '    help="{desc}"\n'
+        ')'
+    ),
+    'number': (
+        'parser.add_argument(\n'
+        '    "--{cli}",\n'
+        '    type=float,\n'
+        '    {required}\n'
+        '    help="{desc}"\n'
+        ')'
+    ),
+    'array': (
+        'parser.add_argument(\n'
+        '    "--{cli}",\n'
+        '    nargs="+",\n'
+        '    type={item_type},\n'
+        '    {required}\n'
+        '    help="{desc}"\n'
+        ')'
+    ),
+    'object': (
+        'parser.add_argument(\n'
+        '    "--{cli}",\n'
+        '    type=str,\n'
+        '    {required}\n'
+        '    help="{desc} (JSON string)"\n'
+        ')'
+    ),
+    'enum': (
+        'parser.add_argument(\n'
+        '    "--{cli}",\n'
+        '    choices={choices},\n'
+        '    {required}\n'
+        '    help="{desc}"\n'
+        ')'
+    ),
+    'string': (
+        'parser.add_argument(\n'
+        '    "--{cli}",\n'
+        '    type=str,\n'
+        '    {required}\n'
+        '    help="{desc}"\n'
+        ')'
+    ),
+}
+
+_NON_STRING_TYPES = ('boolean', 'integer', 'number', 'array', 'object')
+
+# argparse type= names for JSON scalar types; anything else is parsed as str
+_PYTHON_TYPE_NAMES = {
+    'string': 'str',
+    'integer': 'int',
+    'number': 'float',
+    'boolean': 'bool',
+}
+
+# arguments[...] assignment fragments; types not listed use the default
+_ARGS_DICT_TEMPLATES = {
+    'boolean': (
+        'if args.{py}:\n'
+        '    arguments["{prop}"] = True'
+    ),
+    'object': (
+        'if args.{py} is not None:\n'
+        '    import json\n'
+        '    arguments["{prop}"] = json.loads(args.{py})'
+    ),
+}
+_ARGS_DICT_DEFAULT = (
+    'if args.{py} is not None:\n'
+    '    arguments["{prop}"] = args.{py}'
+)
+
+
+def _every_line(line: str) -> bool:
+    """textwrap.indent predicate that also indents whitespace-only lines."""
+    return True
+
+
+# Property names repeat across tools and schemas, so conversions are memoized
+@functools.lru_cache(maxsize=2048)
 def snake_to_kebab(name: str) -> str:
     """Convert snake_case to kebab-case.
 
@@ -13,9 +115,12 @@ def snake_to_kebab(name: str) -> str:
     Returns:
         String in kebab-case
     """
-    return name.replace('_', '-')
+    if '_' not in name:
+        return name
+    return name.translate(_SNAKE_TO_KEBAB)
 
 
+@functools.lru_cache(maxsize=2048)
 def kebab_to_snake(name: str) -> str:
     """Convert kebab-case to snake_case.
 
@@ -25,7 +130,9 @@ def kebab_to_snake(name: str) -> str:
     Returns:
         String in snake_case
     """
-    return name.replace('-', '_')
+    if '-' not in name:
+        return name
+    return name.translate(_KEBAB_TO_SNAKE)
 
 
 def generate_argparse_from_schema(schema: dict[str, Any]) -> tuple[str, str]:
@@ -38,132 +145,53 @@ def generate_argparse_from_schema(schema: dict[str, Any]) -> tuple[str, str]:
         Tuple of (argparse_add_argument_code, args_to_dict_code)
     """
     properties = schema.get('properties', {})
-    required = schema.get('required', [])
+    required = frozenset(schema.get('required', ()))
 
     if not properties:
         # No arguments
         return "    # No arguments required\n    pass", "    arguments = {}"
 
+    # Fragments are emitted unindented and placed in main() at the end
     argparse_lines = []
-    args_dict_lines = ["    # Build arguments dictionary", "    arguments = {}"]
+    args_dict_lines = ["# Build arguments dictionary", "arguments = {}"]
 
     for prop_name, prop_schema in properties.items():
         cli_name = snake_to_kebab(prop_name)
+        # argparse attribute name for --cli-name
+        py_name = kebab_to_snake(cli_name)
         prop_type = prop_schema.get('type', 'string')
-        prop_desc = prop_schema.get('description', '').replace('"', '\\"')
+        prop_desc = prop_schema.get('description', '').translate(_ESCAPE_HELP)
         is_required = prop_name in required
 
-        # Determine argparse parameters
-        if prop_type == 'boolean':
-            # Boolean: use store_true
-            argparse_lines.append(
-                f'    parser.add_argument(\n'
-                f'        "--{cli_name}",\n'
-                f'        action="store_true",\n'
-                f'        help="{prop_desc}"\n'
-                f'    )'
-            )
-            args_dict_lines.append(
-                f'    if args.{kebab_to_snake(cli_name)}:\n'
-                f'        arguments["{prop_name}"] = True'
-            )
-
-        elif prop_type == 'integer':
-            # Integer
-            argparse_lines.append(
-                f'    parser.add_argument(\n'
-                f'        "--{cli_name}",\n'
-                f'        type=int,\n'
-                f'        {"required=True," if is_required else ""}\n'
-                f'        help="{prop_desc}"\n'
-                f'    )'
-            )
-            args_dict_lines.append(
-                f'    if args.{kebab_to_snake(cli_name)} is not None:\n'
-                f'        arguments["{prop_name}"] = args.{kebab_to_snake(cli_name)}'
-            )
-
-        elif prop_type == 'number':
-            # Float/number
-            argparse_lines.append(
-                f'    parser.add_argument(\n'
-                f'        "--{cli_name}",\n'
-                f'        type=float,\n'
-                f'        {"required=True," if is_required else ""}\n'
-                f'        help="{prop_desc}"\n'
-                f'    )'
-            )
-            args_dict_lines.append(
-                f'    if args.{kebab_to_snake(cli_name)} is not None:\n'
-                f'        arguments["{prop_name}"] = args.{kebab_to_snake(cli_name)}'
-            )
-
-        elif prop_type == 'array':
-            # Array: use nargs='+'
+        # Pick the template for this property; unknown types are strings
+        if prop_type in _NON_STRING_TYPES:
+            kind = prop_type
+        elif prop_schema.get('enum'):
+            kind = 'enum'
+        else:
+            kind = 'string'
+
+        fields = {
+            'cli': cli_name,
+            'py': py_name,
+            'prop': prop_name,
+            'desc': prop_desc,
+            'required': "required=True," if is_required else "",
+        }
+        if kind == 'array':
             item_type = prop_schema.get('items', {}).get('type', 'string')
-            python_type = _json_type_to_python_type(item_type)
-
-            argparse_lines.append(
-                f'    parser.add_argument(\n'
-                f'        "--{cli_name}",\n'
-                f'        nargs="+",\n'
-                f'        type={python_type},\n'
-                f'        {"required=True," if is_required else ""}\n'
-                f'        help="{prop_desc}"\n'
-                f'    )'
-            )
-            args_dict_lines.append(
-                f'    if args.{kebab_to_snake(cli_name)} is not None:\n'
-                f'        arguments["{prop_name}"] = args.{kebab_to_snake(cli_name)}'
-            )
-
-        elif prop_type == 'object':
-            # Object: accept as JSON string
-            argparse_lines.append(
-                f'    parser.add_argument(\n'
-                f'        "--{cli_name}",\n'
-                f'        type=str,\n'
-                f'        {"required=True," if is_required else ""}\n'
-                f'        help="{prop_desc} (JSON string)"\n'
-                f'    )'
-            )
-            args_dict_lines.append(
-                f'    if args.{kebab_to_snake(cli_name)} is not None:\n'
-                f'        import json\n'
-                f'        arguments["{prop_name}"] = json.loads(args.{kebab_to_snake(cli_name)})'
-            )
+            fields['item_type'] = _json_type_to_python_type(item_type)
+        elif kind == 'enum':
+            # CLI values are strings; repr quotes and escapes each choice
+            fields['choices'] = repr([str(v) for v in prop_schema['enum']])
 
-        else:
-            # String or unknown: treat as string
-            # Check for enum
-            enum_values = prop_schema.get('enum', [])
-            if enum_values:
-                choices_str = ', '.join(f'"{v}"' for v in enum_values)
-                argparse_lines.append(
-                    f'    parser.add_argument(\n'
-                    f'        "--{cli_name}",\n'
-                    f'        choices=[{choices_str}],\n'
-                    f'        {"required=True," if is_required else ""}\n'
-                    f'        help="{prop_desc}"\n'
-                    f'    )'
-                )
-            else:
-                argparse_lines.append(
-                    f'    parser.add_argument(\n'
-                    f'        "--{cli_name}",\n'
-                    f'        type=str,\n'
-                    f'        {"required=True," if is_required else ""}\n'
-                    f'        help="{prop_desc}"\n'
-                    f'    )'
-                )
-
-            args_dict_lines.append(
-                f'    if args.{kebab_to_snake(cli_name)} is not None:\n'
-                f'        arguments["{prop_name}"] = args.{kebab_to_snake(cli_name)}'
-            )
-
-    argparse_code = '\n'.join(argparse_lines)
-    args_dict_code = '\n'.join(args_dict_lines)
+        argparse_lines.append(_ARGPARSE_TEMPLATES[kind].format_map(fields))
+        args_dict_lines.append(
+            _ARGS_DICT_TEMPLATES.get(kind, _ARGS_DICT_DEFAULT).format_map(fields)
+        )
+
+    argparse_code = textwrap.indent('\n'.join(argparse_lines), '    ', _every_line)
+    args_dict_code = textwrap.indent('\n'.join(args_dict_lines), '    ', _every_line)
 
     return argparse_code, args_dict_code
 
@@ -177,10 +205,4 @@ def _json_type_to_python_type(json_type: str) -> str:
     Returns:
         Python type name as string
     """
-    type_map = {
-        'string': 'str',
-        'integer': 'int',
-        'number': 'float',
-        'boolean': 'bool',
-    }
-    return type_map.get(json_type, 'str')
+    return _PYTHON_TYPE_NAMES.get(json_type, 'str')
@@ -1,8 +1,64 @@
 """Templates for generating SKILL.md and Python scripts."""
 
+import re
+import string
 from typing import Any
 from mcp2skill.schema_utils import generate_argparse_from_schema, snake_to_kebab
 
+# SKILL.md description/intro for well-known servers, matched against the
+# lowercased server name in order; first match wins
+_DESCRIPTION_RULES = [
+    (re.compile('|'.join(map(re.escape, keywords))), description)
+    for keywords, description in (
+        (('chrome', 'browser'), "Browser automation and DevTools control ({tool_count} tools)"),
+        (('figma',), "Figma design tool integration ({tool_count} tools)"),
+        (('filesystem', 'file'), "File system operations ({tool_count} tools)"),
+        (('weather',), "Weather data and forecasts ({tool_count} tools)"),
+    )
+]
+_INTRO_RULES = [
+    ('chrome', "Control Chrome browser programmatically via the Chrome DevTools Protocol. Navigate pages, interact with elements, take screenshots, and more."),
+    ('figma', "Interact with Figma designs, extract design tokens, and automate design workflows."),
+]
+
+# Tool categories for SKILL.md, checked in order; first match wins
+_CATEGORY_KEYWORDS = (
+    ('Page Management', ['page', 'navigate', 'new_', 'list_pages', 'select_page', 'close_page']),
+    ('Element Interaction', ['click', 'fill', 'hover', 'drag', 'press', 'upload']),
+    ('Inspection', ['snapshot', 'screenshot', 'console', 'get_']),
+    ('Network', ['network', 'request']),
+    ('Performance', ['performance', 'trace', 'insight']),
+)
+_CATEGORY_BY_KEYWORD = {
+    keyword: category
+    for category, keywords in reversed(_CATEGORY_KEYWORDS)
+    for keyword in keywords
+}
+# Zero-width lookahead so finditer reports every keyword hit, overlaps included
+_CATEGORY_RE = re.compile(
+    '(?=(' + '|'.join(re.escape(kw) for _, keywords in _CATEGORY_KEYWORDS for kw in keywords) + '))'
+)
+
+
+# Static SKILL.md sections shared by every server
+_QUICK_START_HEADER = """## Quick Start
+
+```bash
+# Navigate to the skill scripts directory
+cd scripts/
+
+# Example: List available options
+"""
+
+_STATE_PERSISTENCE_SECTION = """## State Persistence
+
+This server maintains state between calls (managed by mcp2rest):
+- Sequential commands interact with the same server instance
+- State persists until server restart
+- Multiple scripts can access shared state
+
+"""
+
 
 def create_skill_md(
     server_name: str,
@@ -28,13 +84,9 @@ def create_skill_md(
     # Categorize tools if possible (basic heuristic)
     categories = _categorize_tools(tools)
 
-    # Generate tool listing
-    tool_list = _generate_tool_list(tools, categories)
-
-    # Generate example workflows
-    workflows = _generate_example_workflows(server_name, tools)
-
-    return f"""---
+    # Assemble sections in order and join once at the end
+    parts = [
+        f"""---
 name: mcp-{server_name}
 description: {_generate_description(server_name, server_info, tool_count)}
 ---
@@ -48,28 +100,15 @@ description: {_generate_description(server_name, server_info, tool_count)}
 - {server_name} server loaded in mcp2rest
 - Package: `{package}`
 
-## Quick Start
-
-```bash
-# Navigate to the skill scripts directory
-cd scripts/
-
-# Example: List available options
-python {tools[0]['name']}.py --help
-```
-
-## Available Tools
-
-{tool_list}
-
-## State Persistence
-
-This server maintains state between calls (managed by mcp2rest):
-- Sequential commands interact with the same server instance
-- State persists until server restart
-- Multiple scripts can access shared state
-
-{workflows}
+""",
+        _QUICK_START_HEADER,
+        f"python {tools[0]['name']}.py --help\n```\n\n",
+        "## Available Tools\n\n",
+        _generate_tool_list(tools, categories),
+        "\n\n",
+        _STATE_PERSISTENCE_SECTION,
+        _generate_example_workflows(server_name, tools),
+        f"""
 
 ## Troubleshooting
 
@@ -79,63 +118,38 @@ If you get connection errors:
 3. Check server status in the list
 
 For tool-specific errors, use `--help` flag on any script.
-"""
+""",
+    ]
+    return ''.join(parts)
 
 
 def _generate_description(server_name: str, server_info: dict[str, Any], tool_count: int) -> str:
     """Generate concise skill description."""
-    # Extract key info
-    transport = server_info.get('transport', 'unknown')
-
-    # Common patterns
-    if 'chrome' in server_name.lower() or 'browser' in server_name.lower():
-        return f"Browser automation and DevTools control ({tool_count} tools)"
-    elif 'figma' in server_name.lower():
-        return f"Figma design tool integration ({tool_count} tools)"
-    elif 'filesystem' in server_name.lower() or 'file' in server_name.lower():
-        return f"File system operations ({tool_count} tools)"
-    elif 'weather' in server_name.lower():
-        return f"Weather data and forecasts ({tool_count} tools)"
-    else:
-        return f"MCP server with {tool_count} tools"
+    name = server_name.lower()
+    for pattern, description in _DESCRIPTION_RULES:
+        if pattern.search(name):
+            return description.format(tool_count=tool_count)
+    return f"MCP server with {tool_count} tools"
 
 
 def _generate_intro(server_name: str, server_info: dict[str, Any]) -> str:
     """Generate introduction paragraph."""
-    if 'chrome' in server_name.lower():
-        return "Control Chrome browser programmatically via the Chrome DevTools Protocol. Navigate pages, interact with elements, take screenshots, and more."
-    elif 'figma' in server_name.lower():
-        return "Interact with Figma designs, extract design tokens, and automate design workflows."
-    else:
-        return f"Access {server_name} functionality via REST API."
+    name = server_name.lower()
+    for keyword, intro in _INTRO_RULES:
+        if keyword in name:
+            return intro
+    return f"Access {server_name} functionality via REST API."
 
 
 def _categorize_tools(tools: list[dict[str, Any]]) -> dict[str, list[dict[str, Any]]]:
     """Categorize tools by common patterns."""
-    categories = {
-        'Page Management': [],
-        'Element Interaction': [],
-        'Inspection': [],
-        'Network': [],
-        'Performance': [],
-        'Other': []
-    }
+    categories: dict[str, list[dict[str, Any]]] = {category: [] for category, _ in _CATEGORY_KEYWORDS}
+    categories['Other'] = []
 
     for tool in tools:
-        name = tool['name'].lower()
-
-        if any(kw in name for kw in ['page', 'navigate', 'new_', 'list_pages', 'select_page', 'close_page']):
-            categories['Page Management'].append(tool)
-        elif any(kw in name for kw in ['click', 'fill', 'hover', 'drag', 'press', 'upload']):
-            categories['Element Interaction'].append(tool)
-        elif any(kw in name for kw in ['snapshot', 'screenshot', 'console', 'get_']):
-            categories['Inspection'].append(tool)
-        elif any(kw in name for kw in ['network', 'request']):
-            categories['Network'].append(tool)
-        elif any(kw in name for kw in ['performance', 'trace', 'insight']):
-            categories['Performance'].append(tool)
-        else:
-            categories['Other'].append(tool)
+        matched = {_CATEGORY_BY_KEYWORD[m.group(1)] for m in _CATEGORY_RE.finditer(tool['name'].lower())}
+        category = next((c for c, _ in _CATEGORY_KEYWORDS if c in matched), 'Other')
+        categories[category].append(tool)
 
     # Remove empty categories
     return {k: v for k, v in categories.items() if v}
@@ -232,62 +246,122 @@ python scripts/tool_name.py --arg value
 ```"""
 
 
-def create_mcp_client_script(mcp2rest_url: str) -> str:
-    """Generate shared mcp_client.py utility script.
-
-    Args:
-        mcp2rest_url: Base URL of mcp2rest service
-
-    Returns:
-        Python code for mcp_client.py
-    """
-    return f'''"""Shared MCP REST client for tool scripts."""
+# Body of the shared mcp_client.py, filled in by create_mcp_client_script
+_CLIENT_SCRIPT_TEMPLATE = string.Template('''"""Shared MCP REST client for tool scripts."""
 
+import atexit
 import json
 import os
 import sys
 import requests
 from typing import Any
 
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+try:
+    # Optional: orjson decodes large results (snapshots, screenshots) faster
+    from orjson import dumps as _orjson_dumps, loads as _loads
+
+    def _dumps(obj: Any) -> bytes:
+        try:
+            return _orjson_dumps(obj)
+        except TypeError:
+            # orjson rejects integers wider than 64 bits; json does not
+            return json.dumps(obj).encode("utf-8")
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _loads = json.loads
+
 # MCP2REST endpoint (configurable via environment variable)
-MCP_REST_URL = os.getenv("MCP_REST_URL", "{mcp2rest_url}")
+MCP_REST_URL = os.getenv("MCP_REST_URL", "$mcp2rest_url")
+
+# Default retry budget for call_tool (tool scripts expose --max-retries)
+DEFAULT_MAX_RETRIES = 3
+
 
+def _retry(total: int) -> Retry:
+    """Build the retry policy for mcp2rest calls.
+
+    Connection failures never reach mcp2rest, so they are always safe to
+    retry. Of HTTP responses only 429 and 503 are retried (honouring
+    Retry-After): the call was turned away, so the tool did not run.
+    Other errors fail fast because /call is not idempotent; read timeouts
+    are re-raised as-is so they are reported as timeouts.
+    """
+    return Retry(
+        total=total,
+        read=False,
+        backoff_factor=0.3,
+        status_forcelist=(429, 503),
+        allowed_methods=frozenset(["POST"]),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
 
-def call_tool(server: str, tool: str, arguments: dict[str, Any]) -> str:
+
+_DEFAULT_RETRY = _retry(DEFAULT_MAX_RETRIES)
+
+# Shared session so repeated calls in one process reuse the connection
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=2,
+    pool_maxsize=4,
+    max_retries=_DEFAULT_RETRY,
+)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+atexit.register(_SESSION.close)
+
+
+def call_tool(
+    server: str,
+    tool: str,
+    arguments: dict[str, Any],
+    max_retries: int | None = None
+) -> str:
     """Call an MCP tool via mcp2rest REST API.
 
     Args:
         server: Server name (e.g., "chrome-devtools")
         tool: Tool name (e.g., "click")
         arguments: Tool arguments as dictionary
+        max_retries: Override the retry budget (default: DEFAULT_MAX_RETRIES)
 
     Returns:
         Tool result as formatted string
 
     Raises:
-        SystemExit: If request fails
+        SystemExit: If request fails after retries
     """
-    url = f"{{MCP_REST_URL}}/call"
-    payload = {{
+    # A per-call budget only applies to this call; it is reset in the
+    # finally clause below
+    if max_retries is not None:
+        _ADAPTER.max_retries = _retry(max_retries)
+
+    url = f"{MCP_REST_URL}/call"
+    payload = {
         "server": server,
         "tool": tool,
         "arguments": arguments
-    }}
+    }
 
     try:
-        response = requests.post(
+        response = _SESSION.post(
             url,
-            json=payload,
-            headers={{"Content-Type": "application/json"}},
+            data=_dumps(payload),
+            headers={"Content-Type": "application/json"},
             timeout=30
         )
         response.raise_for_status()
 
-        data = response.json()
+        data = _loads(response.content)
 
         if data.get("success"):
             # Extract and format result
-            result = data.get("result", {{}})
+            result = data.get("result", {})
             content = result.get("content", [])
 
             # Format output nicely
@@ -297,53 +371,51 @@ def call_tool(server: str, tool: str, arguments: dict[str, Any]) -> str:
                     output_parts.append(item.get("text", ""))
                 elif item.get("type") == "image":
                     # For images, just note their presence
-                    output_parts.append(f"[Image data: {{len(item.get('data', ''))}} bytes]")
+                    output_parts.append(f"[Image data: {len(item.get('data', ''))} bytes]")
                 elif item.get("type") == "resource":
-                    output_parts.append(json.dumps(item.get("resource", {{}}), indent=2))
+                    output_parts.append(json.dumps(item.get("resource", {}), indent=2))
 
             return "\\n".join(output_parts) if output_parts else json.dumps(result, indent=2)
         else:
-            error = data.get("error", {{}})
+            error = data.get("error", {})
             error_msg = error.get("message", "Unknown error")
             error_code = error.get("code", "UNKNOWN")
-            print(f"Error [{{error_code}}]: {{error_msg}}", file=sys.stderr)
+            print(f"Error [{error_code}]: {error_msg}", file=sys.stderr)
             sys.exit(1)
 
     except requests.exceptions.ConnectionError:
-        print(f"Error: Cannot connect to mcp2rest at {{MCP_REST_URL}}", file=sys.stderr)
+        print(f"Error: Cannot connect to mcp2rest at {MCP_REST_URL}", file=sys.stderr)
         print("Make sure mcp2rest is running.", file=sys.stderr)
         sys.exit(1)
     except requests.exceptions.Timeout:
         print(f"Error: Request timed out after 30 seconds", file=sys.stderr)
         sys.exit(1)
     except requests.exceptions.HTTPError as e:
-        print(f"Error: HTTP {{e.response.status_code}} - {{e.response.text}}", file=sys.stderr)
+        print(f"Error: HTTP {e.response.status_code} - {e.response.text}", file=sys.stderr)
         sys.exit(1)
     except Exception as e:
-        print(f"Error: {{type(e).__name__}}: {{e}}", file=sys.stderr)
+        print(f"Error: {type(e).__name__}: {e}", file=sys.stderr)
         sys.exit(1)
-'''
+    finally:
+        _ADAPTER.max_retries = _DEFAULT_RETRY
+''')
 
 
-def create_tool_script(server_name: str, tool: dict[str, Any]) -> str:
-    """Generate Python script for a tool.
+def create_mcp_client_script(mcp2rest_url: str) -> str:
+    """Generate shared mcp_client.py utility script.
 
     Args:
-        server_name: Name of the MCP server
-        tool: Tool schema dictionary
+        mcp2rest_url: Base URL of mcp2rest service
 
     Returns:
-        Python code for the tool script
+        Python code for mcp_client.py
     """
-    tool_name = tool['name']
-    description = tool.get('description', f"Execute {tool_name} tool")
-    schema = tool.get('inputSchema', {})
+    return _CLIENT_SCRIPT_TEMPLATE.substitute(mcp2rest_url=mcp2rest_url)
 
-    # Generate argparse code
-    argparse_code, args_to_dict_code = generate_argparse_from_schema(schema)
 
-    return f'''#!/usr/bin/env python3
-"""{description}"""
+# Skeleton of each generated tool script, filled in by create_tool_script
+_TOOL_SCRIPT_TEMPLATE = string.Template('''#!/usr/bin/env python3
+"""$description"""
 
 import argparse
 import sys
@@ -353,21 +425,21 @@ from mcp_client import call_tool
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
-        description="{description}",
+        description="$description",
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
 
-{argparse_code}
-
+$argparse_code
+$retries_code
     args = parser.parse_args()
 
-{args_to_dict_code}
+$args_to_dict_code
 
     # Call the tool
     result = call_tool(
-        server="{server_name}",
-        tool="{tool_name}",
-        arguments=arguments
+        server="$server_name",
+        tool="$tool_name",
+        arguments=arguments$retries_kwarg
     )
 
     # Print result
@@ -380,4 +452,48 @@ if __name__ == "__main__":
     except KeyboardInterrupt:
         print("\\nInterrupted", file=sys.stderr)
         sys.exit(130)
-'''
+''')
+
+
+def create_tool_script(server_name: str, tool: dict[str, Any]) -> str:
+    """Generate Python script for a tool.
+
+    Args:
+        server_name: Name of the MCP server
+        tool: Tool schema dictionary
+
+    Returns:
+        Python code for the tool script
+    """
+    tool_name = tool['name']
+    description = tool.get('description', f"Execute {tool_name} tool")
+    schema = tool.get('inputSchema', {})
+
+    # Generate argparse code
+    argparse_code, args_to_dict_code = generate_argparse_from_schema(schema)
+
+    # Add --max-retries unless the tool already has a parameter by that name
+    cli_names = {snake_to_kebab(name) for name in schema.get('properties', {})}
+    if 'max-retries' in cli_names:
+        retries_code = ''
+        retries_kwarg = ''
+    else:
+        retries_code = (
+            '\n'
+            '    parser.add_argument(\n'
+            '        "--max-retries",\n'
+            '        type=int,\n'
+            '        help="Retries for connection errors and 429/503 responses (default: 3)"\n'
+            '    )\n'
+        )
+        retries_kwarg = ',\n        max_retries=args.max_retries'
+
+    return _TOOL_SCRIPT_TEMPLATE.substitute(
+        description=description,
+        argparse_code=argparse_code,
+        retries_code=retries_code,
+        args_to_dict_code=args_to_dict_code,
+        server_name=server_name,
+        tool_name=tool_name,
+        retries_kwarg=retries_kwarg,
+    )
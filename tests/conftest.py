@@ -1,23 +1,87 @@
 """Pytest configuration and shared fixtures for mcp2skill tests."""
 
+import contextlib
 import json
+import re
 import pytest
-import tempfile
 from pathlib import Path
-from unittest.mock import Mock, MagicMock
+from types import MappingProxyType
 from typing import Any
 
 
-@pytest.fixture
-def mock_mcp2rest_url():
-    """Mock mcp2rest endpoint URL."""
-    return "http://localhost:28888"
+def _freeze(value):
+    """Recursively wrap dicts in MappingProxyType and lists in tuples.
 
+    Session-scoped data fixtures are shared by every test, so they are
+    returned read-only to keep one test from leaking changes into another.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+# Tool names in the mock_tools_response fixture; tests taking a tool_name
+# argument are parametrized over these by pytest_generate_tests
+TOOL_NAMES = ("click", "search", "navigate")
+
+# Third tool in mock_tools_response, built once at import
+_NAVIGATE_TOOL = _freeze({
+    "name": "navigate",
+    "description": "Navigate to a URL",
+    "inputSchema": {
+        "type": "object",
+        "required": ["url"],
+        "properties": {
+            "url": {
+                "type": "string",
+                "description": "URL to navigate to"
+            }
+        }
+    }
+})
 
-@pytest.fixture
+# Closed YAML frontmatter block at the very start of a markdown file
+_FRONTMATTER_RE = re.compile(r'\A---\n(.*?)\n---\n', re.DOTALL)
+
+# Markdown code fence, capturing its info string (language)
+_FENCE_RE = re.compile(r'```(\w*)')
+
+
+def pytest_generate_tests(metafunc):
+    """Parametrize any test requesting tool_name over TOOL_NAMES."""
+    if "tool_name" in metafunc.fixturenames:
+        metafunc.parametrize("tool_name", TOOL_NAMES)
+
+
+# Unpatched HTTPAdapter.send, saved by _block_network for slow_mcp2rest
+_real_adapter_send = None
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _block_network():
+    """Fail fast on any HTTP request that reaches the real transport.
+
+    Tests stub HTTPAdapter.send on top of this (see stub_transport);
+    anything they miss raises instead of waiting on a live mcp2rest.
+    """
+    global _real_adapter_send
+    from requests.adapters import HTTPAdapter
+
+    def _blocked(adapter, request, **kwargs):
+        raise AssertionError(f"Unexpected network request in tests: {request.method} {request.url}")
+
+    _real_adapter_send = HTTPAdapter.send
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(HTTPAdapter, "send", _blocked)
+        yield
+
+
+@pytest.fixture(scope="session")
 def mock_servers_response():
     """Mock response for GET /servers endpoint."""
-    return [
+    return _freeze([
         {
             "name": "chrome-devtools",
             "status": "connected",
@@ -39,13 +103,13 @@ def mock_servers_response():
             "transport": "stdio",
             "package": "test-server"
         }
-    ]
+    ])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_simple_tool():
     """Mock simple tool with basic parameters."""
-    return {
+    return _freeze({
         "name": "click",
         "description": "Click on an element by its selector",
         "inputSchema": {
@@ -63,13 +127,13 @@ def mock_simple_tool():
                 }
             }
         }
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_complex_tool():
     """Mock complex tool with various parameter types."""
-    return {
+    return _freeze({
         "name": "search",
         "description": "Search with complex parameters",
         "inputSchema": {
@@ -106,161 +170,271 @@ def mock_complex_tool():
                 }
             }
         }
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_tools_response(mock_simple_tool, mock_complex_tool):
     """Mock response for GET /servers/{name}/tools endpoint."""
-    return [
-        mock_simple_tool,
-        mock_complex_tool,
-        {
-            "name": "navigate",
-            "description": "Navigate to a URL",
-            "inputSchema": {
-                "type": "object",
-                "required": ["url"],
-                "properties": {
-                    "url": {
-                        "type": "string",
-                        "description": "URL to navigate to"
-                    }
-                }
-            }
-        }
-    ]
+    return (mock_simple_tool, mock_complex_tool, _NAVIGATE_TOOL)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_empty_tool():
     """Mock tool with no input parameters."""
-    return {
+    return _freeze({
         "name": "get_status",
         "description": "Get current status",
         "inputSchema": {
             "type": "object",
             "properties": {}
         }
-    }
+    })
 
 
-@pytest.fixture
-def temp_skill_dir():
-    """Create a temporary directory for skill generation tests."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+@pytest.fixture(scope="module")
+def temp_skill_dir(tmp_path_factory):
+    """Skill output directory shared by the tests of one module.
+
+    Tests that modify generated files or need an empty directory should
+    use temp_skill_dir_fresh instead.
+    """
+    return tmp_path_factory.mktemp("skills", numbered=True)
 
 
 @pytest.fixture
-def mock_requests_get(mock_servers_response, mock_tools_response):
-    """Mock requests.get for mcp2rest API calls."""
-    def _mock_get(url, **kwargs):
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.raise_for_status = Mock()
+def temp_skill_dir_fresh(tmp_path):
+    """Empty per-test skill output directory (cleaned up by pytest)."""
+    return tmp_path
 
-        if url.endswith("/servers"):
-            mock_response.json.return_value = mock_servers_response
-        elif "/tools" in url:
-            mock_response.json.return_value = mock_tools_response
-        else:
-            mock_response.status_code = 404
-            mock_response.raise_for_status.side_effect = Exception("Not found")
 
-        return mock_response
+@pytest.fixture(scope="session")
+def generated_skill(request, tmp_path_factory, mock_servers_response, mock_tools_response):
+    """Generate a skill once per session (and per server) from mock responses.
 
-    return _mock_get
+    The server name defaults to chrome-devtools and can be chosen with
+    indirect parametrization, e.g.
+    ``@pytest.mark.parametrize("generated_skill", ["filesystem"], indirect=True)``.
+    pytest caches one instance per parameter, so the transport is stubbed
+    once per server rather than once per test.
 
+    Tests using this fixture must treat the generated files as read-only.
+    Under pytest-xdist each worker gets its own tmp_path_factory base
+    directory, so every worker generates the skill once and the suite can
+    run with ``pytest -n auto`` when pytest-xdist is installed.
+    """
+    from mcp2skill.generator import SkillGenerator
 
-@pytest.fixture
-def mock_requests_get_error():
-    """Mock requests.get that raises ConnectionError."""
-    def _mock_get(url, **kwargs):
-        raise ConnectionError("Failed to connect to mcp2rest")
+    server_name = getattr(request, "param", "chrome-devtools")
+    with _stub_transport(mock_servers_response, mock_tools_response), SkillGenerator() as gen:
+        return gen.generate_skill(
+            server_name,
+            tmp_path_factory.mktemp("skill", numbered=True)
+        )
 
-    return _mock_get
 
+@pytest.fixture(scope="session")
+def generated_chrome_skill(generated_skill):
+    """The chrome-devtools skill generated once per session."""
+    return generated_skill
 
-@pytest.fixture
-def mock_skill_generator(mock_mcp2rest_url, monkeypatch, mock_requests_get):
-    """Create a SkillGenerator with mocked HTTP requests."""
-    from mcp2skill.generator import SkillGenerator
-    import requests
 
-    # Patch requests.get to use our mock
-    monkeypatch.setattr(requests, "get", mock_requests_get)
+@pytest.fixture(scope="session")
+def script_paths(generated_chrome_skill):
+    """List the generated scripts directory once per session (sorted)."""
+    return sorted((generated_chrome_skill / "scripts").glob("*.py"))
 
-    return SkillGenerator(mock_mcp2rest_url)
 
+@pytest.fixture(scope="session")
+def tool_script_paths(script_paths):
+    """Generated tool scripts, i.e. every script except mcp_client.py."""
+    return [path for path in script_paths if path.name != "mcp_client.py"]
 
-def assert_valid_skill_structure(skill_dir: Path):
-    """Assert that a generated skill has the correct file structure.
 
-    Args:
-        skill_dir: Path to the generated skill directory
+@pytest.fixture(scope="session")
+def scripts_stat_cache(generated_chrome_skill):
+    """Stat every generated script with a single os.scandir pass.
 
-    Raises:
-        AssertionError: If the skill structure is invalid
+    Returns:
+        Dict mapping script filename to its os.stat_result
     """
-    # Check directory exists
-    assert skill_dir.exists(), f"Skill directory does not exist: {skill_dir}"
-    assert skill_dir.is_dir(), f"Skill path is not a directory: {skill_dir}"
+    import os
 
-    # Check SKILL.md exists
-    skill_md = skill_dir / "SKILL.md"
-    assert skill_md.exists(), f"SKILL.md not found in {skill_dir}"
-    assert skill_md.is_file(), f"SKILL.md is not a file: {skill_md}"
+    with os.scandir(generated_chrome_skill / "scripts") as entries:
+        return {entry.name: entry.stat() for entry in entries}
 
-    # Check scripts directory exists
-    scripts_dir = skill_dir / "scripts"
-    assert scripts_dir.exists(), f"scripts directory not found in {skill_dir}"
-    assert scripts_dir.is_dir(), f"scripts is not a directory: {scripts_dir}"
 
-    # Check mcp_client.py exists
-    mcp_client = scripts_dir / "mcp_client.py"
-    assert mcp_client.exists(), f"mcp_client.py not found in {scripts_dir}"
-    assert mcp_client.is_file(), f"mcp_client.py is not a file: {mcp_client}"
+@pytest.fixture(scope="session")
+def parsed_scripts(script_paths):
+    """Read and parse every generated script once per session.
 
+    Each tree is walked once to build a summary, so AST-based tests only
+    do set lookups.
 
-def assert_valid_python_syntax(file_path: Path):
-    """Assert that a Python file has valid syntax.
+    Returns:
+        Dict mapping script filename to its raw bytes, decoded text, AST,
+        module docstring, the frozensets of function names it defines and
+        modules it imports, and whether it has a top-level
+        ``if __name__ == "__main__"`` guard
+    """
+    import ast
+
+    parsed = {}
+    for script_path in script_paths:
+        content = script_path.read_bytes()
+        tree = ast.parse(content)
+        functions = set()
+        imports = set()
+        for node in ast.walk(tree):
+            if isinstance(node, ast.FunctionDef):
+                functions.add(node.name)
+            elif isinstance(node, ast.Import):
+                imports.update(alias.name for alias in node.names)
+            elif isinstance(node, ast.ImportFrom) and node.module:
+                imports.add(node.module)
+        parsed[script_path.name] = {
+            "bytes": content,
+            "text": content.decode("utf-8"),
+            "tree": tree,
+            "docstring": ast.get_docstring(tree),
+            "functions": frozenset(functions),
+            "imports": frozenset(imports),
+            "has_main_guard": any(
+                isinstance(node, ast.If)
+                and isinstance(node.test, ast.Compare)
+                and isinstance(node.test.left, ast.Name)
+                and node.test.left.id == "__name__"
+                and any(
+                    isinstance(c, ast.Constant) and c.value == "__main__"
+                    for c in node.test.comparators
+                )
+                for node in tree.body
+            ),
+        }
+    return parsed
+
+
+@pytest.fixture(scope="session")
+def parsed_skill_md(generated_chrome_skill):
+    """Read and scan the generated SKILL.md once per session.
+
+    Returns:
+        Dict with the SKILL.md text, its frontmatter body (None if missing),
+        H1/H2 header presence, the number of ``` fences and the set of
+        fence languages
+    """
+    text = (generated_chrome_skill / "SKILL.md").read_text()
+    frontmatter = _FRONTMATTER_RE.match(text)
+    fences = [match.group(1) for match in _FENCE_RE.finditer(text)]
+    return {
+        "text": text,
+        "frontmatter": frontmatter.group(1) if frontmatter else None,
+        "has_h1": "\n# " in text,
+        "has_h2": "\n## " in text,
+        "code_block_count": len(fences),
+        "code_block_languages": set(fences),
+    }
+
+
+@contextlib.contextmanager
+def _stub_transport(servers, tools=None, *, status=200, error=None):
+    """Answer mcp2rest GET requests at the transport adapter level.
+
+    Patches HTTPAdapter.send so requests builds real Response objects from
+    canned JSON bodies (encoded once) instead of going through Mock objects.
+    Used as a context manager yielding the list of sent requests, as
+    (url, timeout) pairs; the patch is undone on exit.
 
     Args:
-        file_path: Path to the Python file
+        servers: Payload for GET /servers
+        tools: Payload for GET /servers/{name}/tools, or None to answer 404
+        status: Status code for the servers and tools responses
+        error: Exception raised for every request instead of answering
+    """
+    from urllib.parse import urlsplit
 
-    Raises:
-        AssertionError: If the file has invalid syntax
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    def _encode(payload):
+        return json.dumps(payload, default=dict).encode("utf-8")
+
+    # Keyed on the last URL path segment
+    routes = {"servers": (status, _encode(servers))}
+    if tools is not None:
+        routes["tools"] = (status, _encode(tools))
+    not_found = (404, b'{"error": "Not found"}')
+    sent = []
+
+    def _send(adapter, request, **kwargs):
+        sent.append((request.url, kwargs.get("timeout")))
+        if error is not None:
+            raise error
+        segment = urlsplit(request.url).path.rsplit("/", 1)[-1]
+        status_code, body = routes.get(segment, not_found)
+
+        response = requests.Response()
+        response.status_code = status_code
+        response._content = body
+        response.headers["Content-Type"] = "application/json"
+        response.url = request.url
+        response.request = request
+        return response
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(HTTPAdapter, "send", _send)
+        yield sent
+
+
+@pytest.fixture(scope="session")
+def stub_transport():
+    """Return the _stub_transport context manager factory.
+
+    Session-scoped so module- and class-scoped fixtures can serve mcp2rest
+    responses too; tests usually want serve_mcp2rest instead.
     """
-    import ast
+    return _stub_transport
 
-    assert file_path.exists(), f"File does not exist: {file_path}"
 
-    content = file_path.read_text()
-    try:
-        ast.parse(content)
-    except SyntaxError as e:
-        raise AssertionError(f"Invalid Python syntax in {file_path}: {e}")
+@pytest.fixture
+def serve_mcp2rest():
+    """Return serve(servers, tools=None, **options) answering requests for one test.
 
+    Each call installs a _stub_transport with the given payloads and options
+    and returns its list of sent requests; all of them are undone when the
+    test finishes.
+    """
+    with contextlib.ExitStack() as stack:
+        yield lambda servers, tools=None, **options: stack.enter_context(
+            _stub_transport(servers, tools, **options)
+        )
 
-def assert_script_executable(file_path: Path):
-    """Assert that a script file has executable permissions.
 
-    Args:
-        file_path: Path to the script file
+@pytest.fixture
+def slow_mcp2rest():
+    """Make every request time out while waiting for the response.
+
+    The real HTTPAdapter.send is restored so urllib3's retry handling runs;
+    only the connection pool's request step is stubbed to raise
+    ReadTimeoutError, as a server that accepts but never answers would.
 
-    Raises:
-        AssertionError: If the file is not executable
+    Returns:
+        List collecting the URL of every attempted request
     """
-    import os
-    import stat
+    from requests.adapters import HTTPAdapter
+    from urllib3.connectionpool import HTTPConnectionPool
+    from urllib3.exceptions import ReadTimeoutError
 
-    assert file_path.exists(), f"File does not exist: {file_path}"
+    attempts = []
 
-    st = file_path.stat()
-    is_executable = bool(st.st_mode & stat.S_IXUSR)
+    def _make_request(pool, conn, method, url, *args, **kwargs):
+        attempts.append(url)
+        raise ReadTimeoutError(pool, url, "Read timed out.")
 
-    assert is_executable, f"Script is not executable: {file_path}"
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(HTTPAdapter, "send", _real_adapter_send)
+        mp.setattr(HTTPConnectionPool, "_make_request", _make_request)
+        yield attempts
 
 
 def load_fixture(fixture_name: str) -> Any:
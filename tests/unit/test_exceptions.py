@@ -14,24 +14,33 @@ from mcp2skill.exceptions import (
 )
 
 
+# Exception classes paired with a sample message
+EXCEPTION_MESSAGES = [
+    (MCPError, "test message"),
+    (MCPConnectionError, "connection failed"),
+    (MCPToolError, "tool failed"),
+    (MCPResourceError, "resource not found"),
+    (MCPPromptError, "prompt failed"),
+    (MCPValidationError, "validation failed"),
+    (MCPSamplingError, "sampling failed"),
+    (MCPElicitationError, "elicitation failed"),
+    (MCPConfigError, "config invalid"),
+]
+
+ALL_EXCEPTIONS = [exc_class for exc_class, _ in EXCEPTION_MESSAGES]
+
+
+def _exc_id(exc_class):
+    return exc_class.__name__
+
+
 class TestExceptionHierarchy:
     """Test exception class hierarchy."""
 
-    def test_all_exceptions_inherit_from_mcp_error(self):
+    @pytest.mark.parametrize("exc_class", ALL_EXCEPTIONS[1:], ids=_exc_id)
+    def test_all_exceptions_inherit_from_mcp_error(self, exc_class):
         """Test that all MCP exceptions inherit from MCPError."""
-        exceptions = [
-            MCPConnectionError,
-            MCPToolError,
-            MCPResourceError,
-            MCPPromptError,
-            MCPValidationError,
-            MCPSamplingError,
-            MCPElicitationError,
-            MCPConfigError
-        ]
-
-        for exc_class in exceptions:
-            assert issubclass(exc_class, MCPError)
+        assert issubclass(exc_class, MCPError)
 
     def test_mcp_error_inherits_from_exception(self):
         """Test that MCPError inherits from Exception."""
@@ -41,50 +50,14 @@ class TestExceptionHierarchy:
 class TestExceptionInstantiation:
     """Test that exceptions can be instantiated."""
 
-    def test_mcp_error(self):
-        """Test MCPError instantiation."""
-        exc = MCPError("test message")
-        assert str(exc) == "test message"
-
-    def test_mcp_connection_error(self):
-        """Test MCPConnectionError instantiation."""
-        exc = MCPConnectionError("connection failed")
-        assert str(exc) == "connection failed"
-
-    def test_mcp_tool_error(self):
-        """Test MCPToolError instantiation."""
-        exc = MCPToolError("tool failed")
-        assert str(exc) == "tool failed"
-
-    def test_mcp_resource_error(self):
-        """Test MCPResourceError instantiation."""
-        exc = MCPResourceError("resource not found")
-        assert str(exc) == "resource not found"
-
-    def test_mcp_prompt_error(self):
-        """Test MCPPromptError instantiation."""
-        exc = MCPPromptError("prompt failed")
-        assert str(exc) == "prompt failed"
-
-    def test_mcp_validation_error(self):
-        """Test MCPValidationError instantiation."""
-        exc = MCPValidationError("validation failed")
-        assert str(exc) == "validation failed"
-
-    def test_mcp_sampling_error(self):
-        """Test MCPSamplingError instantiation."""
-        exc = MCPSamplingError("sampling failed")
-        assert str(exc) == "sampling failed"
-
-    def test_mcp_elicitation_error(self):
-        """Test MCPElicitationError instantiation."""
-        exc = MCPElicitationError("elicitation failed")
-        assert str(exc) == "elicitation failed"
-
-    def test_mcp_config_error(self):
-        """Test MCPConfigError instantiation."""
-        exc = MCPConfigError("config invalid")
-        assert str(exc) == "config invalid"
+    @pytest.mark.parametrize(
+        "exc_class,message",
+        EXCEPTION_MESSAGES,
+        ids=[exc_class.__name__ for exc_class, _ in EXCEPTION_MESSAGES]
+    )
+    def test_instantiation(self, exc_class, message):
+        """Test that each exception keeps its message."""
+        assert str(exc_class(message)) == message
 
 
 class TestExceptionRaising:
@@ -1,10 +1,45 @@
 """Tests for generator module."""
 
+import stat
 import pytest
 import requests
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
-from mcp2skill.generator import SkillGenerator
+from unittest.mock import patch
+from mcp2skill.generator import SkillGenerator, _MAX_WORKERS, _scan_dir, _write_if_changed
+
+SERVERS_URL = "http://localhost:28888/servers"
+
+
+@pytest.fixture
+def gen():
+    """Fresh default-URL SkillGenerator, closed after the test."""
+    with SkillGenerator() as generator:
+        yield generator
+
+
+@pytest.fixture(scope="class")
+def generated_skill_dir(
+    stub_transport,
+    mock_servers_response,
+    mock_tools_response,
+    tmp_path_factory
+):
+    """Generate chrome-devtools once into "~/skills", with HOME set to a temp dir.
+
+    Templates are stubbed, so these tests only cover the files
+    generate_skill writes and their permissions.
+    """
+    home = tmp_path_factory.mktemp("home")
+    with (
+        stub_transport(mock_servers_response, mock_tools_response),
+        SkillGenerator() as gen,
+        pytest.MonkeyPatch.context() as mp
+    ):
+        mp.setattr("mcp2skill.generator.create_skill_md", lambda *args, **kwargs: "# SKILL.md content")
+        mp.setattr("mcp2skill.generator.create_mcp_client_script", lambda *args, **kwargs: "# mcp_client.py content")
+        mp.setattr("mcp2skill.generator.create_tool_script", lambda *args, **kwargs: "#!/usr/bin/env python3\nprint('tool')")
+        mp.setenv("HOME", str(home))
+        return gen.generate_skill("chrome-devtools", "~/skills")
 
 
 class TestSkillGeneratorInit:
@@ -15,191 +50,143 @@ class TestSkillGeneratorInit:
         gen = SkillGenerator()
         assert gen.base_url == "http://localhost:28888"
 
-    def test_init_custom_url(self):
-        """Test initialization with custom URL."""
-        gen = SkillGenerator("http://192.168.1.100:5000")
-        assert gen.base_url == "http://192.168.1.100:5000"
-
-    def test_init_strips_trailing_slash(self):
-        """Test that trailing slash is removed from URL."""
-        gen = SkillGenerator("http://localhost:28888/")
-        assert gen.base_url == "http://localhost:28888"
+    @pytest.mark.parametrize("url, expected", [
+        ("http://192.168.1.100:5000", "http://192.168.1.100:5000"),
+        ("http://localhost:28888/", "http://localhost:28888"),
+        ("http://localhost:28888///", "http://localhost:28888"),
+    ], ids=["custom", "trailing-slash", "multiple-trailing-slashes"])
+    def test_init_custom_url(self, url, expected):
+        """Test that custom URLs are kept with trailing slashes removed."""
+        gen = SkillGenerator(url)
+        assert gen.base_url == expected
+
+    def test_init_pooled_session(self):
+        """Test that a retrying adapter is mounted on a shared session."""
+        gen = SkillGenerator()
+        adapter = gen._session.get_adapter("http://localhost:28888/servers")
+        assert adapter.max_retries.total == 3
+        assert 503 in adapter.max_retries.status_forcelist
+        assert gen._session.headers["Accept"] == "application/json"
+        assert adapter._pool_maxsize >= _MAX_WORKERS
 
-    def test_init_multiple_trailing_slashes(self):
-        """Test that multiple trailing slashes are removed."""
-        gen = SkillGenerator("http://localhost:28888///")
-        assert gen.base_url == "http://localhost:28888"
+    def test_context_manager_closes_session(self):
+        """Test that leaving the with-block closes the session."""
+        with patch.object(requests.Session, "close") as mock_close:
+            with SkillGenerator() as gen:
+                assert isinstance(gen, SkillGenerator)
+            mock_close.assert_called_once()
 
 
 class TestListServers:
     """Test list_servers method."""
 
-    def test_list_servers_success(self, monkeypatch, mock_servers_response):
+    def test_list_servers_success(self, serve_mcp2rest, gen, mock_servers_response):
         """Test successful server listing."""
-        mock_response = Mock()
-        mock_response.json.return_value = mock_servers_response
-        mock_response.raise_for_status = Mock()
-
-        mock_get = Mock(return_value=mock_response)
-        monkeypatch.setattr(requests, "get", mock_get)
+        sent = serve_mcp2rest(mock_servers_response)
 
-        gen = SkillGenerator()
         servers = gen.list_servers()
 
         assert len(servers) == 3
         assert servers[0]["name"] == "chrome-devtools"
         assert servers[1]["name"] == "filesystem"
-        mock_get.assert_called_once_with("http://localhost:28888/servers", timeout=10)
+        assert sent == [(SERVERS_URL, 10)]
 
-    def test_list_servers_empty(self, monkeypatch):
-        """Test listing when no servers exist."""
-        mock_response = Mock()
-        mock_response.json.return_value = []
-        mock_response.raise_for_status = Mock()
+    def test_list_servers_cached(self, serve_mcp2rest, gen, mock_servers_response):
+        """Test that the server list is fetched once and reused."""
+        sent = serve_mcp2rest(mock_servers_response)
 
-        monkeypatch.setattr(requests, "get", Mock(return_value=mock_response))
+        gen.list_servers()
+        assert gen.get_server_info("filesystem")["name"] == "filesystem"
+        assert gen.get_server_info("nonexistent") is None
+        assert len(sent) == 1
+
+        gen.list_servers(refresh=True)
+        assert len(sent) == 2
+
+    def test_list_servers_empty(self, serve_mcp2rest, gen):
+        """Test listing when no servers exist."""
+        serve_mcp2rest([])
 
-        gen = SkillGenerator()
         servers = gen.list_servers()
 
         assert servers == []
 
-    def test_list_servers_connection_error(self, monkeypatch):
-        """Test connection error handling."""
-        def mock_get(*args, **kwargs):
-            raise requests.exceptions.ConnectionError("Connection refused")
+    @pytest.mark.parametrize("exc, message", [
+        (requests.exceptions.ConnectionError("Connection refused"), "Cannot connect to mcp2rest"),
+        (requests.exceptions.Timeout("Request timed out"), "Timeout connecting to mcp2rest"),
+    ], ids=["connection-error", "timeout"])
+    def test_list_servers_network_error(self, serve_mcp2rest, gen, exc, message):
+        """Test that connection failures and timeouts become ConnectionError."""
+        serve_mcp2rest([], error=exc)
 
-        monkeypatch.setattr(requests, "get", mock_get)
-
-        gen = SkillGenerator()
-        with pytest.raises(ConnectionError) as exc_info:
+        with pytest.raises(ConnectionError, match=message) as exc_info:
             gen.list_servers()
 
-        assert "Cannot connect to mcp2rest" in str(exc_info.value)
         assert "http://localhost:28888" in str(exc_info.value)
+        assert exc_info.value.__cause__ is exc
 
-    def test_list_servers_timeout(self, monkeypatch):
-        """Test timeout error handling."""
-        def mock_get(*args, **kwargs):
-            raise requests.exceptions.Timeout("Request timed out")
-
-        monkeypatch.setattr(requests, "get", mock_get)
-
-        gen = SkillGenerator()
-        with pytest.raises(ConnectionError) as exc_info:
+    def test_list_servers_read_timeout_not_retried(self, slow_mcp2rest, gen):
+        """Test that a server that never answers is reported as a timeout."""
+        with pytest.raises(ConnectionError, match="Timeout connecting to mcp2rest") as exc_info:
             gen.list_servers()
 
-        assert "Timeout connecting to mcp2rest" in str(exc_info.value)
-
-    def test_list_servers_http_error(self, monkeypatch):
-        """Test HTTP error handling."""
-        mock_response = Mock()
-        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("500 Server Error")
-
-        monkeypatch.setattr(requests, "get", Mock(return_value=mock_response))
-
-        gen = SkillGenerator()
-        with pytest.raises(requests.exceptions.HTTPError):
-            gen.list_servers()
+        assert isinstance(exc_info.value.__cause__, requests.exceptions.ReadTimeout)
+        assert slow_mcp2rest == ["/servers"]
 
 
 class TestGetTools:
     """Test get_tools method."""
 
-    def test_get_tools_success(self, monkeypatch, mock_tools_response, mock_servers_response):
+    def test_get_tools_success(self, serve_mcp2rest, gen, mock_tools_response, mock_servers_response):
         """Test successful tool retrieval."""
-        def mock_get(url, **kwargs):
-            mock_response = Mock()
-            mock_response.raise_for_status = Mock()
-
-            if "/tools" in url:
-                mock_response.json.return_value = mock_tools_response
-            else:
-                mock_response.json.return_value = mock_servers_response
-
-            return mock_response
+        serve_mcp2rest(mock_servers_response, mock_tools_response)
 
-        monkeypatch.setattr(requests, "get", mock_get)
-
-        gen = SkillGenerator()
         tools = gen.get_tools("chrome-devtools")
 
         assert len(tools) == 3
         assert tools[0]["name"] == "click"
         assert tools[1]["name"] == "search"
 
-    def test_get_tools_empty(self, monkeypatch, mock_servers_response):
+    def test_get_tools_empty(self, serve_mcp2rest, gen, mock_servers_response):
         """Test getting tools when none exist."""
-        def mock_get(url, **kwargs):
-            mock_response = Mock()
-            mock_response.raise_for_status = Mock()
-
-            if "/tools" in url:
-                mock_response.json.return_value = []
-            else:
-                mock_response.json.return_value = mock_servers_response
-
-            return mock_response
+        serve_mcp2rest(mock_servers_response, [])
 
-        monkeypatch.setattr(requests, "get", mock_get)
-
-        gen = SkillGenerator()
         tools = gen.get_tools("chrome-devtools")
 
         assert tools == []
 
-    def test_get_tools_server_not_found(self, monkeypatch, mock_servers_response):
+    def test_get_tools_server_not_found(self, serve_mcp2rest, gen, mock_servers_response):
         """Test error when server not found."""
-        def mock_get(url, **kwargs):
-            if "/tools" in url:
-                mock_response = Mock()
-                mock_response.status_code = 404
-                error = requests.exceptions.HTTPError("404 Not Found")
-                error.response = mock_response
-                mock_response.raise_for_status.side_effect = error
-                return mock_response
-            else:
-                # list_servers call
-                mock_response = Mock()
-                mock_response.json.return_value = mock_servers_response
-                mock_response.raise_for_status = Mock()
-                return mock_response
-
-        monkeypatch.setattr(requests, "get", mock_get)
+        serve_mcp2rest(mock_servers_response)  # /tools answers 404
 
-        gen = SkillGenerator()
         with pytest.raises(ValueError) as exc_info:
             gen.get_tools("nonexistent-server")
 
         assert "Server 'nonexistent-server' not found" in str(exc_info.value)
 
-    def test_get_tools_other_http_error(self, monkeypatch):
-        """Test non-404 HTTP errors are raised."""
-        mock_response = Mock()
-        mock_response.status_code = 500
-        error = requests.exceptions.HTTPError("500 Server Error")
-        error.response = mock_response
-        mock_response.raise_for_status.side_effect = error
 
-        monkeypatch.setattr(requests, "get", Mock(return_value=mock_response))
+class TestHttpErrors:
+    """Test that non-404 HTTP errors from mcp2rest propagate."""
 
-        gen = SkillGenerator()
-        with pytest.raises(requests.exceptions.HTTPError):
-            gen.get_tools("chrome-devtools")
+    @pytest.mark.parametrize("fetch", [
+        lambda gen: gen.list_servers(),
+        lambda gen: gen.get_tools("chrome-devtools"),
+    ], ids=["list_servers", "get_tools"])
+    def test_http_error_raised(self, serve_mcp2rest, gen, fetch):
+        """Test that a 500 response is re-raised as HTTPError."""
+        serve_mcp2rest([], [], status=500)
+
+        with pytest.raises(requests.exceptions.HTTPError, match="500 Server Error"):
+            fetch(gen)
 
 
 class TestGetServerInfo:
     """Test get_server_info method."""
 
-    def test_get_server_info_found(self, monkeypatch, mock_servers_response):
+    def test_get_server_info_found(self, serve_mcp2rest, gen, mock_servers_response):
         """Test getting info for existing server."""
-        mock_response = Mock()
-        mock_response.json.return_value = mock_servers_response
-        mock_response.raise_for_status = Mock()
-
-        monkeypatch.setattr(requests, "get", Mock(return_value=mock_response))
+        serve_mcp2rest(mock_servers_response)
 
-        gen = SkillGenerator()
         info = gen.get_server_info("chrome-devtools")
 
         assert info is not None
@@ -207,28 +194,18 @@ class TestGetServerInfo:
         assert info["status"] == "connected"
         assert info["toolCount"] == 15
 
-    def test_get_server_info_not_found(self, monkeypatch, mock_servers_response):
+    def test_get_server_info_not_found(self, serve_mcp2rest, gen, mock_servers_response):
         """Test getting info for non-existent server."""
-        mock_response = Mock()
-        mock_response.json.return_value = mock_servers_response
-        mock_response.raise_for_status = Mock()
-
-        monkeypatch.setattr(requests, "get", Mock(return_value=mock_response))
+        serve_mcp2rest(mock_servers_response)
 
-        gen = SkillGenerator()
         info = gen.get_server_info("nonexistent")
 
         assert info is None
 
-    def test_get_server_info_multiple_servers(self, monkeypatch, mock_servers_response):
+    def test_get_server_info_multiple_servers(self, serve_mcp2rest, gen, mock_servers_response):
         """Test getting correct server from multiple servers."""
-        mock_response = Mock()
-        mock_response.json.return_value = mock_servers_response
-        mock_response.raise_for_status = Mock()
-
-        monkeypatch.setattr(requests, "get", Mock(return_value=mock_response))
+        serve_mcp2rest(mock_servers_response)
 
-        gen = SkillGenerator()
         info = gen.get_server_info("filesystem")
 
         assert info is not None
@@ -239,39 +216,9 @@ class TestGetServerInfo:
 class TestGenerateSkill:
     """Test generate_skill method."""
 
-    @patch('mcp2skill.generator.create_skill_md')
-    @patch('mcp2skill.generator.create_mcp_client_script')
-    @patch('mcp2skill.generator.create_tool_script')
-    def test_generate_skill_success(
-        self,
-        mock_create_tool,
-        mock_create_client,
-        mock_create_md,
-        monkeypatch,
-        mock_servers_response,
-        mock_tools_response,
-        temp_skill_dir
-    ):
+    def test_generate_skill_success(self, generated_skill_dir):
         """Test successful skill generation."""
-        def mock_get(url, **kwargs):
-            mock_response = Mock()
-            mock_response.raise_for_status = Mock()
-
-            if "/tools" in url:
-                mock_response.json.return_value = mock_tools_response
-            else:
-                mock_response.json.return_value = mock_servers_response
-
-            return mock_response
-
-        monkeypatch.setattr(requests, "get", mock_get)
-
-        mock_create_md.return_value = "# SKILL.md content"
-        mock_create_client.return_value = "# mcp_client.py content"
-        mock_create_tool.return_value = "#!/usr/bin/env python3\nprint('tool')"
-
-        gen = SkillGenerator()
-        skill_dir = gen.generate_skill("chrome-devtools", temp_skill_dir)
+        skill_dir = generated_skill_dir
 
         # Verify skill directory created
         assert skill_dir.exists()
@@ -294,122 +241,107 @@ class TestGenerateSkill:
         assert mcp_client.read_text() == "# mcp_client.py content"
 
         # Verify tool scripts created (3 tools in mock_tools_response)
-        tool_scripts = list(scripts_dir.glob("*.py"))
+        tool_scripts = [name for name in _scan_dir(scripts_dir) if name.endswith(".py")]
         assert len(tool_scripts) == 4  # 3 tools + mcp_client.py
 
-    def test_generate_skill_server_not_found(self, monkeypatch, mock_servers_response):
-        """Test error when server doesn't exist."""
-        mock_response = Mock()
-        mock_response.json.return_value = mock_servers_response
-        mock_response.raise_for_status = Mock()
-
-        monkeypatch.setattr(requests, "get", Mock(return_value=mock_response))
-
-        gen = SkillGenerator()
-        with pytest.raises(ValueError) as exc_info:
-            gen.generate_skill("nonexistent", "/tmp")
-
-        assert "Server 'nonexistent' not found" in str(exc_info.value)
-
-    def test_generate_skill_no_tools(self, monkeypatch, mock_servers_response):
-        """Test error when server has no tools."""
-        def mock_get(url, **kwargs):
-            mock_response = Mock()
-            mock_response.raise_for_status = Mock()
-
-            if "/tools" in url:
-                mock_response.json.return_value = []
-            else:
-                mock_response.json.return_value = mock_servers_response
-
-            return mock_response
-
-        monkeypatch.setattr(requests, "get", mock_get)
-
-        gen = SkillGenerator()
-        with pytest.raises(ValueError) as exc_info:
-            gen.generate_skill("chrome-devtools", "/tmp")
+    def test_generate_skill_expands_user_path(self, generated_skill_dir, tmp_path_factory):
+        """Test that ~ in path is expanded."""
+        assert "~" not in generated_skill_dir.parts
+        assert generated_skill_dir.parent.name == "skills"
+        assert generated_skill_dir.is_relative_to(tmp_path_factory.getbasetemp())
 
-        assert "has no tools available" in str(exc_info.value)
+    def test_generate_skill_sets_executable(self, generated_skill_dir):
+        """Test that generated tool scripts are made executable."""
+        scripts_dir = generated_skill_dir / "scripts"
+        for name, st in _scan_dir(scripts_dir).items():
+            if name.endswith(".py") and name != "mcp_client.py":
+                assert bool(st.st_mode & stat.S_IXUSR), f"{name} is not executable"
 
-    @patch('mcp2skill.generator.create_skill_md')
-    @patch('mcp2skill.generator.create_mcp_client_script')
-    @patch('mcp2skill.generator.create_tool_script')
-    def test_generate_skill_expands_user_path(
+    @patch('mcp2skill.generator.create_skill_md', return_value="# SKILL.md")
+    def test_generate_skill_with_server_info(
         self,
-        mock_create_tool,
-        mock_create_client,
         mock_create_md,
-        monkeypatch,
+        serve_mcp2rest,
+        gen,
         mock_servers_response,
         mock_tools_response,
         temp_skill_dir
     ):
-        """Test that ~ in path is expanded."""
-        def mock_get(url, **kwargs):
-            mock_response = Mock()
-            mock_response.raise_for_status = Mock()
-
-            if "/tools" in url:
-                mock_response.json.return_value = mock_tools_response
-            else:
-                mock_response.json.return_value = mock_servers_response
+        """Test that a provided server_info skips the /servers lookup."""
+        sent = serve_mcp2rest(mock_servers_response, mock_tools_response)
 
-            return mock_response
+        gen.generate_skill(
+            "chrome-devtools",
+            temp_skill_dir,
+            server_info=mock_servers_response[0]
+        )
 
-        monkeypatch.setattr(requests, "get", mock_get)
-        mock_create_md.return_value = "content"
-        mock_create_client.return_value = "content"
-        mock_create_tool.return_value = "content"
-
-        gen = SkillGenerator()
+        assert sent == [(f"{SERVERS_URL}/chrome-devtools/tools", 10)]
+        assert mock_create_md.call_args.kwargs["server_info"] is mock_servers_response[0]
 
-        # Use temp_skill_dir as the base
-        with patch.object(Path, 'expanduser', return_value=temp_skill_dir):
-            skill_dir = gen.generate_skill("chrome-devtools", "~/skills")
+    def test_generate_skill_server_not_found(self, serve_mcp2rest, gen, mock_servers_response):
+        """Test error when server doesn't exist."""
+        serve_mcp2rest(mock_servers_response)
 
-        assert skill_dir.exists()
+        with pytest.raises(ValueError) as exc_info:
+            gen.generate_skill("nonexistent", "/tmp")
 
-    @patch('mcp2skill.generator.create_skill_md')
-    @patch('mcp2skill.generator.create_mcp_client_script')
-    @patch('mcp2skill.generator.create_tool_script')
-    def test_generate_skill_sets_executable(
-        self,
-        mock_create_tool,
-        mock_create_client,
-        mock_create_md,
-        monkeypatch,
-        mock_servers_response,
-        mock_tools_response,
-        temp_skill_dir
-    ):
-        """Test that generated tool scripts are made executable."""
-        def mock_get(url, **kwargs):
-            mock_response = Mock()
-            mock_response.raise_for_status = Mock()
+        assert "Server 'nonexistent' not found" in str(exc_info.value)
 
-            if "/tools" in url:
-                mock_response.json.return_value = mock_tools_response
-            else:
-                mock_response.json.return_value = mock_servers_response
+    def test_generate_skill_no_tools(self, serve_mcp2rest, gen, mock_servers_response):
+        """Test error when server has no tools."""
+        serve_mcp2rest(mock_servers_response, [])
 
-            return mock_response
+        with pytest.raises(ValueError) as exc_info:
+            gen.generate_skill("chrome-devtools", "/tmp")
 
-        monkeypatch.setattr(requests, "get", mock_get)
-        mock_create_md.return_value = "content"
-        mock_create_client.return_value = "content"
-        mock_create_tool.return_value = "#!/usr/bin/env python3\nprint('test')"
+        assert "has no tools available" in str(exc_info.value)
 
-        gen = SkillGenerator()
-        skill_dir = gen.generate_skill("chrome-devtools", temp_skill_dir)
 
-        # Check that tool scripts are executable
-        scripts_dir = skill_dir / "scripts"
-        for script in scripts_dir.glob("*.py"):
-            if script.name != "mcp_client.py":
-                import stat
-                st = script.stat()
-                assert bool(st.st_mode & stat.S_IXUSR), f"{script} is not executable"
+class TestWriteIfChanged:
+    """Test _write_if_changed helper."""
+
+    def test_writes_new_file(self, temp_skill_dir_fresh):
+        """Test that a missing file is created."""
+        path = temp_skill_dir_fresh / "tool.py"
+        assert _write_if_changed(path, "print('hi')\n", 0o755)
+        assert path.read_text() == "print('hi')\n"
+        assert path.stat().st_mode & 0o777 == 0o755
+
+    def test_skips_unchanged_file(self, temp_skill_dir_fresh):
+        """Test that identical content is not rewritten."""
+        path = temp_skill_dir_fresh / "SKILL.md"
+        path.write_text("# Skill")
+        with patch.object(Path, "write_bytes") as mock_write:
+            assert not _write_if_changed(path, "# Skill")
+        mock_write.assert_not_called()
+
+    def test_rewrites_changed_file(self, temp_skill_dir_fresh):
+        """Test that different content replaces the file."""
+        path = temp_skill_dir_fresh / "SKILL.md"
+        path.write_text("# Old")
+        assert _write_if_changed(path, "# New")
+        assert path.read_text() == "# New"
+
+    def test_uses_scanned_stats(self, temp_skill_dir_fresh):
+        """Test that a directory snapshot avoids reading files of another size."""
+        path = temp_skill_dir_fresh / "tool.py"
+        path.write_text("old content\n")
+        existing = _scan_dir(temp_skill_dir_fresh)
+
+        with patch.object(Path, "read_bytes") as mock_read:
+            assert _write_if_changed(path, "new\n", 0o755, existing)
+        mock_read.assert_not_called()
+        assert path.read_text() == "new\n"
+        assert path.stat().st_mode & 0o777 == 0o755
+
+    def test_restores_mode_on_unchanged_file(self, temp_skill_dir_fresh):
+        """Test that permissions are fixed even when content is unchanged."""
+        path = temp_skill_dir_fresh / "tool.py"
+        path.write_text("pass\n")
+        path.chmod(0o644)
+        assert not _write_if_changed(path, "pass\n", 0o755)
+        assert path.stat().st_mode & 0o777 == 0o755
 
 
 class TestGenerateAllSkills:
@@ -419,20 +351,16 @@ class TestGenerateAllSkills:
     def test_generate_all_skills_success(
         self,
         mock_generate,
-        monkeypatch,
+        serve_mcp2rest,
+        gen,
         mock_servers_response,
         temp_skill_dir
     ):
         """Test generating skills for all connected servers."""
-        mock_response = Mock()
-        mock_response.json.return_value = mock_servers_response
-        mock_response.raise_for_status = Mock()
-
-        monkeypatch.setattr(requests, "get", Mock(return_value=mock_response))
+        serve_mcp2rest(mock_servers_response)
 
         mock_generate.return_value = temp_skill_dir / "mcp-test"
 
-        gen = SkillGenerator()
         skill_dirs = gen.generate_all_skills(temp_skill_dir)
 
         # Should generate for 2 connected servers with tools (chrome-devtools, filesystem)
@@ -444,7 +372,8 @@ class TestGenerateAllSkills:
     def test_generate_all_skills_skips_disconnected(
         self,
         mock_generate,
-        monkeypatch,
+        serve_mcp2rest,
+        gen,
         temp_skill_dir
     ):
         """Test that disconnected servers are skipped."""
@@ -454,14 +383,9 @@ class TestGenerateAllSkills:
             {"name": "server3", "status": "connected", "toolCount": 2}
         ]
 
-        mock_response = Mock()
-        mock_response.json.return_value = servers
-        mock_response.raise_for_status = Mock()
-
-        monkeypatch.setattr(requests, "get", Mock(return_value=mock_response))
+        serve_mcp2rest(servers)
         mock_generate.return_value = temp_skill_dir / "test"
 
-        gen = SkillGenerator()
         skill_dirs = gen.generate_all_skills(temp_skill_dir)
 
         # Should only generate for 2 connected servers
@@ -472,7 +396,8 @@ class TestGenerateAllSkills:
     def test_generate_all_skills_skips_no_tools(
         self,
         mock_generate,
-        monkeypatch,
+        serve_mcp2rest,
+        gen,
         temp_skill_dir
     ):
         """Test that servers with no tools are skipped."""
@@ -482,14 +407,9 @@ class TestGenerateAllSkills:
             {"name": "server3", "status": "connected", "toolCount": 2}
         ]
 
-        mock_response = Mock()
-        mock_response.json.return_value = servers
-        mock_response.raise_for_status = Mock()
-
-        monkeypatch.setattr(requests, "get", Mock(return_value=mock_response))
+        serve_mcp2rest(servers)
         mock_generate.return_value = temp_skill_dir / "test"
 
-        gen = SkillGenerator()
         skill_dirs = gen.generate_all_skills(temp_skill_dir)
 
         # Should only generate for 2 servers with tools
@@ -500,17 +420,14 @@ class TestGenerateAllSkills:
     def test_generate_all_skills_handles_errors(
         self,
         mock_generate,
-        monkeypatch,
+        serve_mcp2rest,
+        gen,
         mock_servers_response,
         temp_skill_dir,
         capsys
     ):
         """Test that errors in individual skill generation are caught."""
-        mock_response = Mock()
-        mock_response.json.return_value = mock_servers_response
-        mock_response.raise_for_status = Mock()
-
-        monkeypatch.setattr(requests, "get", Mock(return_value=mock_response))
+        serve_mcp2rest(mock_servers_response)
 
         # First call succeeds, second fails
         mock_generate.side_effect = [
@@ -518,7 +435,6 @@ class TestGenerateAllSkills:
             ValueError("Test error")
         ]
 
-        gen = SkillGenerator()
         skill_dirs = gen.generate_all_skills(temp_skill_dir)
 
         # Should return 1 successful generation
@@ -526,18 +442,57 @@ class TestGenerateAllSkills:
 
         # Check that warning was printed
         captured = capsys.readouterr()
-        assert "Warning:" in captured.out
+        assert "Warning: Failed to generate skill for " in captured.out
         assert "Test error" in captured.out
 
-    def test_generate_all_skills_empty_servers(self, monkeypatch, temp_skill_dir):
-        """Test generating when no servers exist."""
-        mock_response = Mock()
-        mock_response.json.return_value = []
-        mock_response.raise_for_status = Mock()
+    @patch('mcp2skill.generator.SkillGenerator.generate_skill')
+    def test_generate_all_skills_preserves_order(
+        self,
+        mock_generate,
+        serve_mcp2rest,
+        gen,
+        temp_skill_dir
+    ):
+        """Test that results follow server order despite parallel generation."""
+        servers = [
+            {"name": f"server{i}", "status": "connected", "toolCount": 1}
+            for i in range(12)
+        ]
 
-        monkeypatch.setattr(requests, "get", Mock(return_value=mock_response))
+        serve_mcp2rest(servers)
+        mock_generate.side_effect = lambda name, output_dir, **kwargs: temp_skill_dir / f"mcp-{name}"
+
+        skill_dirs = gen.generate_all_skills(temp_skill_dir)
+
+        assert skill_dirs == [temp_skill_dir / f"mcp-server{i}" for i in range(12)]
+
+    @patch('mcp2skill.generator.SkillGenerator.generate_skill')
+    def test_generate_all_skills_passes_server_info(
+        self,
+        mock_generate,
+        serve_mcp2rest,
+        gen,
+        mock_servers_response,
+        temp_skill_dir
+    ):
+        """Test that each server entry is handed down and /servers is fetched once."""
+        sent = serve_mcp2rest(mock_servers_response)
+        mock_generate.return_value = temp_skill_dir / "test"
+
+        gen.list_servers()
+        gen.generate_all_skills(temp_skill_dir)
+        assert len(sent) == 1
+
+        gen.generate_all_skills(temp_skill_dir, refresh=True)
+        assert len(sent) == 2
+
+        passed = sorted(c.kwargs["server_info"]["name"] for c in mock_generate.call_args_list)
+        assert passed == ["chrome-devtools"] * 2 + ["filesystem"] * 2
+
+    def test_generate_all_skills_empty_servers(self, serve_mcp2rest, gen, temp_skill_dir):
+        """Test generating when no servers exist."""
+        serve_mcp2rest([])
 
-        gen = SkillGenerator()
         skill_dirs = gen.generate_all_skills(temp_skill_dir)
 
         assert skill_dirs == []
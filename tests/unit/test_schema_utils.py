@@ -1,5 +1,7 @@
 """Tests for schema_utils module."""
 
+import textwrap
+
 import pytest
 from mcp2skill.schema_utils import (
     snake_to_kebab,
@@ -12,37 +14,25 @@ from mcp2skill.schema_utils import (
 class TestNamingConversions:
     """Test naming convention conversion functions."""
 
-    def test_snake_to_kebab_basic(self):
-        """Test basic snake_case to kebab-case conversion."""
-        assert snake_to_kebab("hello_world") == "hello-world"
-
-    def test_snake_to_kebab_multiple_underscores(self):
-        """Test conversion with multiple underscores."""
-        assert snake_to_kebab("this_is_a_test") == "this-is-a-test"
-
-    def test_snake_to_kebab_no_underscores(self):
-        """Test conversion with no underscores."""
-        assert snake_to_kebab("hello") == "hello"
-
-    def test_snake_to_kebab_empty(self):
-        """Test conversion with empty string."""
-        assert snake_to_kebab("") == ""
-
-    def test_kebab_to_snake_basic(self):
-        """Test basic kebab-case to snake_case conversion."""
-        assert kebab_to_snake("hello-world") == "hello_world"
-
-    def test_kebab_to_snake_multiple_hyphens(self):
-        """Test conversion with multiple hyphens."""
-        assert kebab_to_snake("this-is-a-test") == "this_is_a_test"
-
-    def test_kebab_to_snake_no_hyphens(self):
-        """Test conversion with no hyphens."""
-        assert kebab_to_snake("hello") == "hello"
-
-    def test_kebab_to_snake_empty(self):
-        """Test conversion with empty string."""
-        assert kebab_to_snake("") == ""
+    @pytest.mark.parametrize("name, expected", [
+        ("hello_world", "hello-world"),
+        ("this_is_a_test", "this-is-a-test"),
+        ("hello", "hello"),
+        ("", ""),
+    ])
+    def test_snake_to_kebab(self, name, expected):
+        """Test snake_case to kebab-case conversion."""
+        assert snake_to_kebab(name) == expected
+
+    @pytest.mark.parametrize("name, expected", [
+        ("hello-world", "hello_world"),
+        ("this-is-a-test", "this_is_a_test"),
+        ("hello", "hello"),
+        ("", ""),
+    ])
+    def test_kebab_to_snake(self, name, expected):
+        """Test kebab-case to snake_case conversion."""
+        assert kebab_to_snake(name) == expected
 
     def test_roundtrip_conversion(self):
         """Test that conversions are reversible."""
@@ -55,29 +45,17 @@ class TestNamingConversions:
 class TestJsonTypeToPythonType:
     """Test JSON Schema type to Python type conversion."""
 
-    def test_string_type(self):
-        """Test string type mapping."""
-        assert _json_type_to_python_type("string") == "str"
-
-    def test_integer_type(self):
-        """Test integer type mapping."""
-        assert _json_type_to_python_type("integer") == "int"
-
-    def test_number_type(self):
-        """Test number type mapping."""
-        assert _json_type_to_python_type("number") == "float"
-
-    def test_boolean_type(self):
-        """Test boolean type mapping."""
-        assert _json_type_to_python_type("boolean") == "bool"
-
-    def test_unknown_type(self):
-        """Test unknown type defaults to str."""
-        assert _json_type_to_python_type("unknown") == "str"
-
-    def test_empty_type(self):
-        """Test empty type defaults to str."""
-        assert _json_type_to_python_type("") == "str"
+    @pytest.mark.parametrize("json_type, expected", [
+        ("string", "str"),
+        ("integer", "int"),
+        ("number", "float"),
+        ("boolean", "bool"),
+        ("unknown", "str"),  # unknown types default to str
+        ("", "str"),
+    ])
+    def test_type_mapping(self, json_type, expected):
+        """Test JSON Schema type name mapping."""
+        assert _json_type_to_python_type(json_type) == expected
 
 
 class TestGenerateArgparseFromSchema:
@@ -274,13 +252,32 @@ class TestGenerateArgparseFromSchema:
         argparse_code, args_dict_code = generate_argparse_from_schema(schema)
 
         assert '--mode' in argparse_code
-        assert 'choices=[' in argparse_code
-        assert '"fast"' in argparse_code
-        assert '"normal"' in argparse_code
-        assert '"slow"' in argparse_code
+        assert "choices=['fast', 'normal', 'slow']" in argparse_code
         assert 'required=True' in argparse_code
         assert 'Operation mode' in argparse_code
 
+    def test_enum_choices_are_escaped(self):
+        """Test that enum values with quotes or non-string types stay valid choices."""
+        schema = {
+            "type": "object",
+            "properties": {
+                "quote": {"type": "string", "enum": ['say "hi"', "it's"]},
+                "level": {"type": "string", "enum": [1, 2]}
+            }
+        }
+
+        argparse_code, args_dict_code = generate_argparse_from_schema(schema)
+
+        namespace = {}
+        exec(
+            "import argparse\nparser = argparse.ArgumentParser()\n"
+            + textwrap.dedent(argparse_code),
+            namespace
+        )
+        actions = namespace["parser"]._option_string_actions
+        assert actions["--quote"].choices == ['say "hi"', "it's"]
+        assert actions["--level"].choices == ["1", "2"]
+
     def test_snake_case_to_kebab_case_conversion(self):
         """Test that snake_case properties become kebab-case CLI args."""
         schema = {
@@ -347,6 +344,30 @@ class TestGenerateArgparseFromSchema:
         # Should escape quotes
         assert '\\"quotes\\"' in argparse_code or "\\\"quotes\\\"" in argparse_code
 
+    def test_description_with_backslashes_and_newlines(self):
+        """Test that backslashes and newlines survive as a valid help string."""
+        description = 'Path like C:\\temp\\\nSecond line'
+        schema = {
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": description
+                }
+            }
+        }
+
+        argparse_code, args_dict_code = generate_argparse_from_schema(schema)
+
+        namespace = {}
+        exec(
+            "import argparse\nparser = argparse.ArgumentParser()\n"
+            + textwrap.dedent(argparse_code),
+            namespace
+        )
+        action = namespace["parser"]._option_string_actions["--path"]
+        assert action.help == description
+
     def test_missing_description(self):
         """Test parameter without description."""
         schema = {